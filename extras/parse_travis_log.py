@@ -30,231 +30,557 @@ NOTE: Please note that the parsing process is coupled to shell script
 """
 
 
-def is_message_pair_in_logfile(log_filename, msg_start_of_section,
-                               msg_end_of_section):
-    """Read the NEST Travis CI build log file and return 'True' in case both
-    messages are found in correct order. Return 'False' if only the first
-    message was found. Return 'None' in case the first or both messages
-    are not contained in the file.
+import hashlib
+import mmap
+import os
+import re
+import stat
+import sys
+import tempfile
+from collections import OrderedDict, defaultdict, namedtuple
+from contextlib import closing, contextmanager
+from functools import partial
+
+
+# Message numbers of the sections and messages written to the log file by
+# 'build.sh' and 'extras/static_code_analysis.sh'.
+MSG_CHANGED_FILES_START = b"MSGBLD0070"
+MSG_CHANGED_FILE = b"MSGBLD0095"
+MSG_CHANGED_FILES_END = b"MSGBLD0100"
+MSG_VERA_START = b"MSGBLD0130"
+MSG_VERA = b"MSGBLD0135"
+MSG_VERA_END = b"MSGBLD0140"
+MSG_CPPCHECK_START = b"MSGBLD0150"
+MSG_CPPCHECK = b"MSGBLD0155"
+MSG_CPPCHECK_END = b"MSGBLD0160"
+MSG_FORMAT_START = b"MSGBLD0170"
+MSG_FORMAT = b"MSGBLD0175"
+MSG_FORMAT_END = b"MSGBLD0180"
+MSG_PEP8_START = b"MSGBLD0190"
+MSG_PEP8 = b"MSGBLD0195"
+MSG_PEP8_END = b"MSGBLD0200"
+MSG_MAKE_START = b"MSGBLD0250"
+MSG_MAKE_END = b"MSGBLD0260"
+MSG_TESTSUITE_START = b"MSGBLD0290"
+MSG_TESTSUITE_END = b"MSGBLD0300"
+MSG_NO_S3_UPLOAD = b"MSGBLD0330"
+
+# Return all message numbers contained in a line. The pattern is compiled
+# and its 'findall' method looked up only once.
+find_msg_numbers = re.compile(b'MSGBLD[0-9]{4}').findall
+
+# Return the match of the first number contained in a line.
+find_number = re.compile(b'[0-9]+').search
+
+# Return a match if a cppcheck line is not reported in the summary: progress
+# lines, unused variables and information about missing includes.
+find_cppcheck_noise = re.compile(
+    br'Checking|is never used|\(information\)').search
+
+# Return the match of a cppcheck message, starting with its severity in
+# parentheses, e.g. '(style) The scope of the variable ...'.
+find_cppcheck_message = re.compile(br'\([^)]+\).*').search
+
+
+# Everything extracted from the NEST Travis CI build log file by parse_log().
+LogSummary = namedtuple('LogSummary', ['msg_numbers',
+                                       'changed_files',
+                                       'summary_vera',
+                                       'summary_cppcheck',
+                                       'summary_format',
+                                       'summary_pep8',
+                                       'makebuild',
+                                       'testsuite'])
+
+
+@contextmanager
+def mapped_log(log_filename):
+    """Context manager memory-mapping the NEST Travis CI build log file
+    read-only.
 
     Parameters
     ----------
-    log_filename:         NEST Travis CI build log file name.
-    msg_start_of_section: Message number string, e.g. "MSGBLD1234".
-    msg_end_of_section:   Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
-    True, False or None.
+    mmap.mmap object or None for an empty file, which cannot be mapped.
     """
 
-    pair_found = None
-    with open(log_filename) as fh:
-        for line in fh:
-            if pair_found is None and is_message(line, msg_start_of_section):
-                pair_found = False
-            if not pair_found and is_message(line, msg_end_of_section):
-                pair_found = True
+    with open(log_filename, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield None
+        else:
+            with closing(mmap.mmap(fh.fileno(), 0,
+                                   access=mmap.ACCESS_READ)) as mm:
+                yield mm
 
-    return(pair_found)
 
+def log_lines(log_filename):
+    """Memory-map the NEST Travis CI build log file and yield its lines.
+
+    Parameters
+    ----------
+    log_filename: NEST Travis CI build log file name.
+
+    Returns
+    -------
+    Generator of lines as undecoded byte strings.
+    """
+
+    with mapped_log(log_filename) as mm:
+        if mm is not None:
+            for line in iter(mm.readline, b''):
+                yield line
+
+
+def decode(text):
+    """Decode a byte string extracted from the NEST Travis CI build log file.
+
+    Parameters
+    ----------
+    text: Byte string.
+
+    Returns
+    -------
+    Unicode string.
+    """
+
+    return(text.decode('utf-8', 'replace'))
+
+
+def message_after_last_colon(line):
+    """Return the text behind the last colon of a VERA++, clang-format or PEP8
+    message line.
+
+    Parameters
+    ----------
+    line: A single line from the NEST CI build log file.
+
+    Returns
+    -------
+    Message string.
+    """
+
+    return(decode(line.rpartition(b':')[2].strip()))
 
-def is_message_in_logfile(log_filename, msg_number):
-    """Read the NEST Travis CI build log file. Return 'True' if the message is
-    contained in the log file.
+
+def cppcheck_message(line):
+    """Return the message of a cppcheck message line or None if the line
+    contains no message relevant for the build summary.
+
+    Parameters
+    ----------
+    line: A single line from the NEST CI build log file.
+
+    Returns
+    -------
+    None or message string.
+    """
+
+    if find_cppcheck_noise(line):
+        return(None)
+    match = find_cppcheck_message(line)
+    if match is None:
+        return(None)
+
+    return(decode(match.group().strip()))
+
+
+# Static code analysis sections per tool: message numbers of the start of a
+# section, of the messages and of the end of a section as well as the
+# function extracting the message from a line.
+CODE_ANALYSIS_SECTIONS = {
+    'vera': (MSG_VERA_START, MSG_VERA, MSG_VERA_END,
+             message_after_last_colon),
+    'cppcheck': (MSG_CPPCHECK_START, MSG_CPPCHECK, MSG_CPPCHECK_END,
+                 cppcheck_message),
+    'format': (MSG_FORMAT_START, MSG_FORMAT, MSG_FORMAT_END,
+               message_after_last_colon),
+    'pep8': (MSG_PEP8_START, MSG_PEP8, MSG_PEP8_END,
+             message_after_last_colon),
+}
+
+
+class LogParser(object):
+    """State machine extracting the information required for the build
+    summary from the lines of the NEST Travis CI build log file.
+
+    Lines containing message numbers are passed to msg_line(), which
+    dispatches them to the handler registered for the message number. All
+    other lines are only of interest within the 'make' and the
+    'make installcheck' section and are passed to make_line() or
+    testsuite_line(), respectively.
+    """
+
+    def __init__(self):
+        self.msg_numbers = set()
+
+        # File names and messages recur across the summaries of the tools.
+        # Equal strings share one object (see interned()). Byte strings and
+        # decoded strings are kept apart, since Python 2 considers an ASCII
+        # byte string equal to the decoded string.
+        self.interned_bytes = {}
+        self.interned_text = {}
+
+        self.changed_files = []
+        self.in_changed_files_section = False
+        self.changed_files_section_done = False
+
+        # Per tool: the dictionary of dictionaries of messages per file and
+        # the dictionary of the file in the currently open section (or None).
+        self.code_analysis_msgs = dict.fromkeys(CODE_ANALYSIS_SECTIONS)
+        self.single_file_msgs = dict.fromkeys(CODE_ANALYSIS_SECTIONS)
+
+        self.makebuild = (None, None, None, None, None)
+        self.error_summary = None
+        self.warning_summary = None
+        self.in_make_section = False
+        self.make_section_done = False
+
+        self.in_installcheck_section = False
+        self.in_results_section = False
+        self.total_number_of_tests = None
+        self.number_of_tests_failed = None
+        self.status_tests = None
+        self.installcheck_section_done = False
+
+        # True as soon as the rest of the log file is of no interest.
+        self.done = False
+
+        self.handlers = {
+            MSG_CHANGED_FILES_START: self.changed_files_start,
+            MSG_CHANGED_FILE: self.changed_file,
+            MSG_CHANGED_FILES_END: self.changed_files_end,
+            MSG_MAKE_START: self.make_start,
+            MSG_MAKE_END: self.make_end,
+            MSG_TESTSUITE_START: self.testsuite_start,
+            MSG_TESTSUITE_END: self.testsuite_end,
+            MSG_NO_S3_UPLOAD: self.no_s3_upload,
+        }
+        for tool, (msg_start, msg, msg_end, extract_message) in \
+                CODE_ANALYSIS_SECTIONS.items():
+            self.handlers[msg_start] = partial(self.code_analysis_start, tool)
+            self.handlers[msg] = partial(self.code_analysis_msg, tool,
+                                         extract_message)
+            self.handlers[msg_end] = partial(self.code_analysis_end, tool)
+
+    def msg_line(self, line):
+        """Process a line of the log file containing message numbers."""
+
+        for msg_number in find_msg_numbers(line):
+            self.msg_numbers.add(msg_number)
+            handler = self.handlers.get(msg_number)
+            if handler is not None:
+                handler(line)
+
+    def log_summary(self):
+        """Return the LogSummary of all lines processed."""
+
+        # Changed files are only reported for a complete section.
+        if self.changed_files_section_done:
+            changed_files = self.changed_files
+        else:
+            changed_files = []
+
+        return(LogSummary(self.msg_numbers,
+                          changed_files,
+                          self.code_analysis_msgs['vera'],
+                          self.code_analysis_msgs['cppcheck'],
+                          self.code_analysis_msgs['format'],
+                          self.code_analysis_msgs['pep8'],
+                          self.makebuild,
+                          (self.status_tests, self.total_number_of_tests,
+                           self.number_of_tests_failed)))
+
+    def interned(self, text):
+        """Return the first string of the same type equal to text seen by
+        this parser."""
+
+        if isinstance(text, bytes):
+            return(self.interned_bytes.setdefault(text, text))
+        return(self.interned_text.setdefault(text, text))
+
+    def changed_files_start(self, line):
+        # The log file contains only one 'changed-files-section'.
+        if not self.changed_files_section_done:
+            self.in_changed_files_section = True
+
+    def changed_file(self, line):
+        if self.in_changed_files_section:
+            self.changed_files.append(
+                self.interned(decode(line.rpartition(b' ')[2].strip())))
+
+    def changed_files_end(self, line):
+        if self.in_changed_files_section:
+            self.in_changed_files_section = False
+            self.changed_files_section_done = True
+
+    def code_analysis_start(self, tool, line):
+        if self.single_file_msgs[tool] is None:
+            # The file name is decoded when the tables are printed.
+            source_filename = \
+                self.interned(line.rpartition(b' ')[2].strip())
+            if self.code_analysis_msgs[tool] is None:
+                self.code_analysis_msgs[tool] = {}
+            self.single_file_msgs[tool] = defaultdict(int)
+            self.code_analysis_msgs[tool][source_filename] = \
+                self.single_file_msgs[tool]
+
+    def code_analysis_msg(self, tool, extract_message, line):
+        single_file_msgs = self.single_file_msgs[tool]
+        if single_file_msgs is not None:
+            message = extract_message(line)
+            if message is not None:
+                single_file_msgs[self.interned(message)] += 1
+
+    def code_analysis_end(self, tool, line):
+        self.single_file_msgs[tool] = None
+
+    def make_start(self, line):
+        # The log file contains only one 'make' section.
+        if not self.make_section_done:
+            self.in_make_section = True
+            self.error_summary = defaultdict(int)
+            self.warning_summary = defaultdict(int)
+
+    def make_line(self, line):
+        # A compiler message is either an error or a warning. The totals are
+        # summed up at the end of the section.
+        if b': error:' in line:
+            self.error_summary[decode(line.partition(b':')[0])] += 1
+        elif b': warning:' in line:
+            self.warning_summary[decode(line.partition(b':')[0])] += 1
+
+    def make_end(self, line):
+        if not self.make_section_done:
+            self.make_section_done = True
+            number_of_error_msgs = 0
+            number_of_warning_msgs = 0
+            if self.in_make_section:
+                number_of_error_msgs = sum(self.error_summary.values())
+                number_of_warning_msgs = sum(self.warning_summary.values())
+            self.in_make_section = False
+            self.makebuild = (number_of_error_msgs == 0,
+                              number_of_error_msgs,
+                              self.error_summary,
+                              number_of_warning_msgs,
+                              self.warning_summary)
+
+    def testsuite_start(self, line):
+        # The log file contains only one 'make-installcheck' section.
+        if not self.installcheck_section_done:
+            self.in_installcheck_section = True
+
+    def testsuite_line(self, line):
+        if line.startswith(b"NEST Testsuite Summary"):
+            self.in_results_section = True
+
+        if self.in_results_section:
+            if b"Total number of tests:" in line:
+                self.total_number_of_tests = int(line.rpartition(b' ')[2])
+            if b"Failed" in line:
+                self.number_of_tests_failed = \
+                    int(find_number(line).group())
+
+    def testsuite_end(self, line):
+        if self.in_installcheck_section:
+            self.in_installcheck_section = False
+            self.installcheck_section_done = True
+            self.status_tests = self.number_of_tests_failed == 0
+
+    def no_s3_upload(self, line):
+        # The Amazon S3 message is the last message of 'build.sh'. It follows
+        # the 'make installcheck' section.
+        if self.installcheck_section_done:
+            self.done = True
+
+
+def parse_log(log_filename):
+    """Read the NEST Travis CI build log file once and extract the
+    information required for the build summary from all of its sections.
 
     Parameters
     ----------
     log_filename: NEST Travis CI build log file name.
-    msg_number:   Message number string, e.g. "MSGBLD1234".
 
     Returns
     -------
-    True or False.
+    LogSummary containing the set of message numbers found, the list of
+    changed files, the summaries of the static code analysis, the 'make'
+    summary and the test suite results.
+    """
+
+    parser = LogParser()
+    msg_line = parser.msg_line
+    make_line = parser.make_line
+    testsuite_line = parser.testsuite_line
+    for line in log_lines(log_filename):
+        # Most lines neither contain a message number nor belong to a section
+        # which is read line by line. They are rejected by the first test.
+        if b'MSGBLD' in line:
+            msg_line(line)
+            if parser.done:
+                break
+        elif parser.in_make_section:
+            make_line(line)
+        elif parser.in_installcheck_section:
+            testsuite_line(line)
+
+    return(parser.log_summary())
+
+
+# Results of parse_log() keyed by log file name, modification time and size,
+# least recently used first. At most PARSED_LOG_CACHE_SIZE are kept.
+PARSED_LOG_CACHE_SIZE = 4
+_parsed_log_cache = OrderedDict()
+
+
+def parsed_log_cache_key(log_filename):
+    """Return the key of the NEST Travis CI build log file in the cache of
+    parse_log() results.
+
+    Parameters
+    ----------
+    log_filename: NEST Travis CI build log file name.
+
+    Returns
+    -------
+    Tuple of file name, modification time and size.
+    """
+
+    stat = os.stat(log_filename)
+    # Nanosecond resolution is only available with Python 3.
+    return((log_filename, getattr(stat, 'st_mtime_ns', stat.st_mtime),
+            stat.st_size))
+
+
+def cached_parse_log(log_filename):
+    """Return the result of parse_log() for the NEST Travis CI build log
+    file. The log file is parsed only once as long as it is not modified.
+
+    Parameters
+    ----------
+    log_filename: NEST Travis CI build log file name.
+
+    Returns
+    -------
+    LogSummary, see parse_log().
     """
 
-    with open(log_filename) as fh:
-        for line in fh:
-            if is_message(line, msg_number):
-                return(True)
+    key = parsed_log_cache_key(log_filename)
+    log_summary = _parsed_log_cache.pop(key, None)
+    if log_summary is None:
+        log_summary = parse_log(log_filename)
+        if len(_parsed_log_cache) >= PARSED_LOG_CACHE_SIZE:
+            _parsed_log_cache.popitem(last=False)
+    _parsed_log_cache[key] = log_summary
 
-    return(False)
+    return(log_summary)
 
 
-def is_message(line, msg_number):
-    """Return 'True' if 'line' contains the message identified by 'msg_number'.
+def is_message_pair_in_logfile(log_filename, msg_start_of_section,
+                               msg_end_of_section):
+    """Read the NEST Travis CI build log file and return 'True' in case both
+    messages are found in correct order. Return 'False' if only the first
+    message was found. Return 'None' in case the first or both messages
+    are not contained in the file.
 
     Parameters
     ----------
-    line:       A single line from the NEST CI build log file.
-    msg_number: Message number string.
+    log_filename:         NEST Travis CI build log file name.
+    msg_start_of_section: Message number byte string, e.g. b"MSGBLD1234".
+    msg_end_of_section:   Message number byte string, e.g. b"MSGBLD1234".
 
     Returns
     -------
-    True or False
+    True, False or None.
     """
 
-    if msg_number in line:
+    msg_numbers = cached_parse_log(log_filename).msg_numbers
+    if msg_end_of_section in msg_numbers:
         return(True)
+    if msg_start_of_section in msg_numbers:
+        return(False)
 
-    return(False)
+    return(None)
 
 
-def list_of_changed_files(log_filename, msg_changed_files_section_start,
-                          msg_changed_files_section_end, msg_changed_files):
-    """Read the NEST Travis CI build log file, find the 'changed files' section
-    and return a list of the changed files or an empty list, respectively.
+def is_message_in_logfile(log_filename, msg_number):
+    """Read the NEST Travis CI build log file. Return 'True' if the message is
+    contained in the log file.
 
     Parameters
     ----------
-    log_filename:                    NEST Travis CI build log file name.
-    msg_changed_files_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_changed_files_section_end:   Message number string, e.g. "MSGBLD1234".
-    msg_changed_files:               Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
+    msg_number:   Message number byte string, e.g. b"MSGBLD1234".
 
     Returns
     -------
-    List of changed files.
+    True or False.
     """
 
-    changed_files = []
-    if not is_message_pair_in_logfile(log_filename,
-                                      msg_changed_files_section_start,
-                                      msg_changed_files_section_end):
-        return(changed_files)
+    return(msg_number in cached_parse_log(log_filename).msg_numbers)
 
-    in_changed_files_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if not in_changed_files_section and \
-                    is_message(line, msg_changed_files_section_start):
-                in_changed_files_section = True
-                continue
 
-            if in_changed_files_section:
-                if is_message(line, msg_changed_files):
-                    changed_files.append(line.split(' ')[-1].strip())
-                    continue
+def list_of_changed_files(log_filename):
+    """Read the NEST Travis CI build log file, find the 'changed files' section
+    and return a list of the changed files or an empty list, respectively.
+
+    Parameters
+    ----------
+    log_filename: NEST Travis CI build log file name.
 
-                if is_message(line, msg_changed_files_section_end):
-                    # The log file contains only one 'changed-files-section'.
-                    # Stop reading the log file.
-                    return(changed_files)
+    Returns
+    -------
+    List of changed files.
+    """
 
-    return(changed_files)
+    return(cached_parse_log(log_filename).changed_files)
 
 
-def msg_summary_vera(log_filename, msg_vera_section_start,
-                     msg_vera_section_end, msg_vera):
+def msg_summary_vera(log_filename):
     """Read the NEST Travis CI build log file, find the VERA++ sections,
     extract the VERA messages per file and return a dictionary containing an
     overall summary of the VERA++ code analysis.
 
     Parameters
     ----------
-    log_filename:           NEST Travis CI build log file name.
-    msg_vera_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_vera_section_end:   Message number string, e.g. "MSGBLD1234".
-    msg_vera:               Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
     None or a dictionary of dictionaries of VERA++ messages per file.
     """
 
-    all_vera_msgs = None
-    in_a_vera_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if not in_a_vera_section and is_message(line,
-                                                    msg_vera_section_start):
-                in_a_vera_section = True
-                source_filename = line.split(' ')[-1].strip()
-                single_file_vera_msgs = {}
-                if all_vera_msgs is None:
-                    all_vera_msgs = {}
-                all_vera_msgs.update({source_filename: single_file_vera_msgs})
-                continue
-
-            if in_a_vera_section:
-                if is_message(line, msg_vera):
-                    message = line.split(":")[-1].strip()
-                    if message not in single_file_vera_msgs:
-                        single_file_vera_msgs[message] = 0
-                    single_file_vera_msgs[message] += 1
-                    continue
-
-                if is_message(line, msg_vera_section_end):
-                    in_a_vera_section = False
-
-    return(all_vera_msgs)
+    return(cached_parse_log(log_filename).summary_vera)
 
 
-def msg_summary_cppcheck(log_filename, msg_cppcheck_section_start,
-                         msg_cppcheck_section_end, msg_cppcheck):
+def msg_summary_cppcheck(log_filename):
     """Read the NEST Travis CI build log file, find the cppcheck sections,
     extract the cppcheck messages per file and return a dictionary containing
     an overall summary of the cppcheck code analysis.
 
     Parameters
     ---------
-    log_filename:               NEST Travis CI build log file name.
-    msg_cppcheck_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_cppcheck_section_end:   Message number string, e.g. "MSGBLD1234".
-    msg_cppcheck:               Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
     None or a dictionary of dictionaries of cppcheck messages per file.
     """
 
-    all_cppcheck_msgs = None
-    in_a_cppcheck_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if not in_a_cppcheck_section and \
-                    is_message(line, msg_cppcheck_section_start):
-                in_a_cppcheck_section = True
-                source_filename = line.split(' ')[-1].strip()
-                single_file_cppcheck_msgs = {}
-                if all_cppcheck_msgs is None:
-                    all_cppcheck_msgs = {}
-                all_cppcheck_msgs.update({source_filename:
-                                          single_file_cppcheck_msgs})
-                continue
-
-            if in_a_cppcheck_section:
-                if is_message(line, msg_cppcheck):
-                    if 'Checking' in line:
-                        continue
-                    message = line[line.find('('):].strip()
-                    if 'is never used' in message:
-                        continue
-                    if '(information)' in message:
-                        continue
-                    if message not in single_file_cppcheck_msgs:
-                        single_file_cppcheck_msgs[message] = 0
-                    single_file_cppcheck_msgs[message] += 1
-                    continue
-
-                if is_message(line, msg_cppcheck_section_end):
-                    in_a_cppcheck_section = False
+    return(cached_parse_log(log_filename).summary_cppcheck)
 
-    return(all_cppcheck_msgs)
 
-
-def msg_summary_format(log_filename, msg_format_section_start,
-                       msg_format_section_end, msg_format):
+def msg_summary_format(log_filename):
     """Read the NEST Travis CI build log file, find the clang-format sections,
     extract the 'diff-messages' per file and return a dictionary containing an
     overall summary of the clang-format code analysis.
 
     Parameters
     ----------
-    log_filename:             NEST Travis CI build log file name.
-    msg_format_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_format_section_end:   Message number string, e.g. "MSGBLD1234".
-    msg_format:               Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
@@ -262,89 +588,34 @@ def msg_summary_format(log_filename, msg_format_section_start,
     file.
     """
 
-    all_format_msgs = None
-    in_a_format_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if not in_a_format_section and is_message(line, msg_format_section_start):  # noqa
-                in_a_format_section = True
-                source_filename = line.split(' ')[-1].strip()
-                single_file_format_msgs = {}
-                if all_format_msgs is None:
-                    all_format_msgs = {}
-                all_format_msgs.update({source_filename: single_file_format_msgs})      # noqa
-                continue
-
-            if in_a_format_section:
-                if is_message(line, msg_format):
-                    diffline = line.split(":")[-1].strip()
-                    if diffline not in single_file_format_msgs:
-                        single_file_format_msgs[diffline] = 0
-                    single_file_format_msgs[diffline] += 1
-                    continue
-
-                if is_message(line, msg_format_section_end):
-                    in_a_format_section = False
+    return(cached_parse_log(log_filename).summary_format)
 
-    return(all_format_msgs)
 
-
-def msg_summary_pep8(log_filename, msg_pep8_section_start,
-                     msg_pep8_section_end, msg_pep8):
+def msg_summary_pep8(log_filename):
     """Read the NEST Travis CI build log file, find the PEP8 sections, extract
     the PEP8 messages per file and return a dictionary containing an overall
     summary.
 
     Parameters:
     ----------
-    log_filename:           NEST Travis CI build log file name.
-    msg_pep8_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_pep8_section_end:   Message number string, e.g. "MSGBLD1234".
-    msg_pep8:               Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
     None or a dictionary of dictionaries of PEP8 messages per file.
     """
 
-    all_pep8_msgs = None
-    in_a_pep8_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if not in_a_pep8_section and is_message(line, msg_pep8_section_start):      # noqa
-                in_a_pep8_section = True
-                source_filename = line.split(' ')[-1].strip()
-                single_file_pep8_msgs = {}
-                if all_pep8_msgs is None:
-                    all_pep8_msgs = {}
-                all_pep8_msgs.update({source_filename: single_file_pep8_msgs})
-                continue
-
-            if in_a_pep8_section:
-                if is_message(line, msg_pep8):
-                    message = line.split(":")[-1].strip()
-                    if message not in single_file_pep8_msgs:
-                        single_file_pep8_msgs[message] = 0
-                    single_file_pep8_msgs[message] += 1
-                    continue
-
-                if is_message(line, msg_pep8_section_end):
-                    in_a_pep8_section = False
+    return(cached_parse_log(log_filename).summary_pep8)
 
-    return(all_pep8_msgs)
 
-
-def makebuild_summary(log_filename, msg_make_section_start,
-                      msg_make_section_end):
+def makebuild_summary(log_filename):
     """Read the NEST Travis CI build log file and return the number of build
     error and warning messages as well as dictionaries summarizing their
     occurrences.
 
     Parameters
     ----------
-    log_filename:           NEST Travis CI build log file name.
-    msg_make_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_make_section_end:   Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
@@ -355,47 +626,10 @@ def makebuild_summary(log_filename, msg_make_section_start,
     Dictionary of file names and the number of warnings within these file.
     """
 
-    error_summary = None
-    warning_summary = None
-    number_of_error_msgs = 0
-    number_of_warning_msgs = 0
-    in_make_section = False
-    with open(log_filename) as fh:
-        for line in fh:
-            if is_message(line, msg_make_section_start):
-                in_make_section = True
-                error_summary = {}
-                warning_summary = {}
-
-            if in_make_section:
-                if ': error:' in line:
-                    file_name = line.split(':')[0]
-                    if file_name not in error_summary:
-                        error_summary[file_name] = 0
-                    error_summary[file_name] += 1
-                    number_of_error_msgs += 1
-
-                if ': warning:' in line:
-                    file_name = line.split(':')[0]
-                    if file_name not in warning_summary:
-                        warning_summary[file_name] = 0
-                    warning_summary[file_name] += 1
-                    number_of_warning_msgs += 1
-
-            if is_message(line, msg_make_section_end):
-                # The log file contains only one 'make' section, return.
-                if number_of_error_msgs == 0:
-                    return(True, number_of_error_msgs, error_summary,
-                           number_of_warning_msgs, warning_summary)
-                else:
-                    return(False, number_of_error_msgs, error_summary,
-                           number_of_warning_msgs, warning_summary)
-
-    return(None, None, None, None, None)
-
-
-def testsuite_results(log_filename, msg_testsuite_section_start,
-                      msg_testsuite_end_message):
+    return(cached_parse_log(log_filename).makebuild)
+
+
+def testsuite_results(log_filename):
     """Read the NEST Travis CI build log file, find the 'make-installcheck'
     section which runs the NEST test suite. Extract the total number of tests
     and the number of tests failed. Return True if all tests passed
@@ -405,9 +639,7 @@ def testsuite_results(log_filename, msg_testsuite_section_start,
 
     Parameters
     ----------
-    log_filename:                NEST Travis CI build log file name.
-    msg_testsuite_section_start: Message number string, e.g. "MSGBLD1234".
-    msg_testsuite_end_message:   Message number string, e.g. "MSGBLD1234".
+    log_filename: NEST Travis CI build log file name.
 
     Returns
     -------
@@ -416,37 +648,7 @@ def testsuite_results(log_filename, msg_testsuite_section_start,
     Number of tests failed.
     """
 
-    in_installcheck_section = False
-    in_results_section = False
-    total_number_of_tests = None
-    number_of_tests_failed = None
-    status_tests = None
-    with open(log_filename) as fh:
-        for line in fh:
-            if is_message(line, msg_testsuite_section_start):
-                in_installcheck_section = True
-
-            if in_installcheck_section:
-                if line.strip() == "NEST Testsuite Summary":
-                    in_results_section = True
-
-                if in_results_section:
-                    if "Total number of tests:" in line:
-                        total_number_of_tests = int(line.split(' ')[-1])
-                    if "Failed" in line:
-                        number_of_tests_failed = \
-                            [int(s) for s in line.split() if s.isdigit()][0]
-
-                if is_message(line, msg_testsuite_end_message):
-                    if number_of_tests_failed == 0:
-                        status_tests = True
-                    else:
-                        status_tests = False
-                    # The log file contains only one 'make-installcheck'
-                    # section. Stop reading the log file.
-                    break
-
-    return(status_tests, total_number_of_tests, number_of_tests_failed)
+    return(cached_parse_log(log_filename).testsuite)
 
 
 def convert_bool_value_to_status_string(value):
@@ -526,36 +728,70 @@ def number_of_msgs_in_summary(summary):
     The total number of messages contained in the dictionary.
     """
 
-    number_of_msgs = 0
-    if summary is not None:
-        for file_name in summary.keys():
-            number_of_msgs += \
-                number_of_msgs_for_file_in_summary(file_name, summary)
+    if summary is None:
+        return(0)
+
+    # map() keeps both loops, over the files and over their counts, in C.
+    return(sum(map(sum, map(dict.values, summary.values()))))
+
+
+def is_any_msg_in_summary(summary):
+    """Return 'True' if the summary of any static code analysis contains at
+    least one message. Unlike number_of_msgs_in_summary(), stop at the first
+    file with messages.
+
+    Parameters
+    ----------
+    summary: A dictionary containing per file dictionaries of static code
+             analysis messages.
+
+    Returns
+    -------
+    True or False.
+    """
+
+    if summary is None:
+        return(False)
+
+    # Every message is counted at least once, i.e. the dictionary of a file
+    # without messages is empty.
+    return(any(summary.values()))
+
 
-    return(number_of_msgs)
+# Width of the build report. terminaltables, which was used to create it
+# before, took the width of the terminal, or 79 characters if the standard
+# input is not a terminal as on Travis CI.
+REPORT_WIDTH = 79
 
 
-def number_of_msgs_for_file_in_summary(file_name, summary):
-    """Return the number of messages of any static code analysis for a
-    particular source file.
+def ascii_table(table_data):
+    """Create a table with a border around each cell. The layout is identical
+    to that of a terminaltables.AsciiTable with inner row borders.
 
     Parameters
     ----------
-    file_name: Source file name.
-    summary:   A dictionary containing per file dictionaries of static code
-               analysis messages.
+    table_data: List of rows, each a list of cell strings. A cell may contain
+                several lines.
 
     Returns
     -------
-    The number of messages for the source file contained in the dictionary.
+    Formatted table string.
     """
 
-    number_of_messages = 0
-    if summary is not None:
-        for message, occurrences in summary[file_name].iteritems():
-            number_of_messages += occurrences
+    rows = [[cell.split('\n') for cell in row] for row in table_data]
+    column_widths = [max(len(line) for cell in column for line in cell)
+                     for column in zip(*rows)]
+    border = '+' + '+'.join('-' * (width + 2) for width in column_widths) + '+'
+
+    lines = [border]
+    for row in rows:
+        for i in range(max(len(cell) for cell in row)):
+            cells = [(cell[i] if i < len(cell) else '').ljust(width)
+                     for cell, width in zip(row, column_widths)]
+            lines.append('| ' + ' | '.join(cells) + ' |')
+        lines.append(border)
 
-    return(number_of_messages)
+    return('\n'.join(lines))
 
 
 def code_analysis_per_file_tables(summary_vera, summary_cppcheck,
@@ -576,7 +812,7 @@ def code_analysis_per_file_tables(summary_vera, summary_cppcheck,
     Formatted tables string.
     """
 
-    all_tables = ''
+    all_tables = []
 
     # VERA++, cppcheck, clang-format
     if summary_vera is not None and summary_cppcheck is not None and \
@@ -589,63 +825,48 @@ def code_analysis_per_file_tables(summary_vera, summary_cppcheck,
         assert (summary_format.keys() == summary_vera.keys())
 
         # Again: Identical keys for clang-format, cppcheck and VERA++.
-        for file in summary_format.keys():
-            file_table = ''
-
-            number_of_vera_messages = \
-                number_of_msgs_for_file_in_summary(file, summary_vera)
-            number_of_cppcheck_messages = \
-                number_of_msgs_for_file_in_summary(file, summary_cppcheck)
-            number_of_format_messages = \
-                number_of_msgs_for_file_in_summary(file, summary_format)
-
-            if number_of_vera_messages > 0 or \
-               number_of_cppcheck_messages > 0 or \
-               number_of_format_messages > 0:
-
-                file_table = [['+ + + ' + file + ' + + +', '']]
+        # Every message is counted at least once, i.e. the dictionary of a
+        # file without messages is empty.
+        for file, format_msgs in summary_format.items():
+            vera_msgs = summary_vera[file]
+            cppcheck_msgs = summary_cppcheck[file]
+            if not (vera_msgs or cppcheck_msgs or format_msgs):
+                continue
 
-                if number_of_vera_messages > 0:
-                    file_table.append(['VERA++ (MSGBLD0135):', 'Count'])
-                    for message, count in summary_vera[file].iteritems():
-                        file_table.append([str(message), str(count)])
+            file_table = [['+ + + ' + decode(file) + ' + + +', '']]
 
-                if number_of_cppcheck_messages > 0:
-                    file_table.append(['Cppcheck (MSGBLD0155):', 'Count'])
-                    for message, count in summary_cppcheck[file].iteritems():
-                        file_table.append([str(message), str(count)])
+            if vera_msgs:
+                file_table.append(['VERA++ (MSGBLD0135):', 'Count'])
+                file_table.extend([[message, str(count)] for message, count
+                                   in vera_msgs.items()])
 
-                if number_of_format_messages > 0:
-                    file_table.append(['clang-format (MSGBLD0175):', 'Count'])
-                    for message, count in summary_format[file].iteritems():
-                        file_table.append([str(message), str(count)])
+            if cppcheck_msgs:
+                file_table.append(['Cppcheck (MSGBLD0155):', 'Count'])
+                file_table.extend([[message, str(count)] for message, count
+                                   in cppcheck_msgs.items()])
 
-                table = AsciiTable(file_table)
-                table.inner_row_border = True
-                file_table = table.table + '\n'
+            if format_msgs:
+                file_table.append(['clang-format (MSGBLD0175):', 'Count'])
+                file_table.extend([[message, str(count)] for message, count
+                                   in format_msgs.items()])
 
-            all_tables += file_table
+            all_tables.append(ascii_table(file_table) + '\n')
 
     # PEP8
     if summary_pep8 is not None:
-        for file in summary_pep8.keys():
-            file_table = ''
-
-            if number_of_msgs_for_file_in_summary(file, summary_pep8) > 0:
-
-                file_table = [['+ + + ' + file + ' + + +', '']]
+        for file, pep8_msgs in summary_pep8.items():
+            if not pep8_msgs:
+                continue
 
-                file_table.append(['PEP8 (MSGBLD0195):', 'Count'])
-                for message, count in summary_pep8[file].iteritems():
-                    file_table.append([str(message), str(count)])
+            file_table = [['+ + + ' + decode(file) + ' + + +', '']]
 
-                table = AsciiTable(file_table)
-                table.inner_row_border = True
-                file_table = table.table + '\n'
+            file_table.append(['PEP8 (MSGBLD0195):', 'Count'])
+            file_table.extend([[message, str(count)] for message, count
+                               in pep8_msgs.items()])
 
-            all_tables += file_table
+            all_tables.append(ascii_table(file_table) + '\n')
 
-    return(all_tables)
+    return(''.join(all_tables))
 
 
 def warnings_table(summary):
@@ -663,13 +884,9 @@ def warnings_table(summary):
 
     file_table = [['Warnings in file:', 'Count']]
 
-    for file in summary.keys():
-        file_table.append([file, summary[file]])
+    file_table.extend([[file, str(count)] for file, count in summary.items()])
 
-    table = AsciiTable(file_table)
-    table.inner_row_border = True
-
-    return(table.table + '\n')
+    return(ascii_table(file_table) + '\n')
 
 
 def errors_table(summary):
@@ -687,13 +904,46 @@ def errors_table(summary):
 
     file_table = [['Errors in file:', 'Count']]
 
-    for file in summary.keys():
-        file_table.append([file, summary[file]])
+    file_table.extend([[file, str(count)] for file, count in summary.items()])
 
-    table = AsciiTable(file_table)
-    table.inner_row_border = True
+    return(ascii_table(file_table) + '\n')
 
-    return(table.table + '\n')
+
+def wrap_file_names(file_names, width):
+    """Create a comma separated list of file names wrapped to lines of at
+    most the given width. A file name is never split, unless it is longer
+    than a line itself.
+
+    Parameters
+    ----------
+    file_names: List of file names.
+    width:      Maximum line width.
+
+    Returns
+    -------
+    Wrapped list string.
+    """
+
+    width = max(width, 1)
+    lines = []
+    line = ''
+    last = len(file_names) - 1
+    for i, file_name in enumerate(file_names):
+        if i < last:
+            file_name += ','
+        if line and len(line) + 1 + len(file_name) <= width:
+            line += ' ' + file_name
+            continue
+        if line:
+            lines.append(line)
+        while len(file_name) > width:
+            lines.append(file_name[:width])
+            file_name = file_name[width:]
+        line = file_name
+    if line:
+        lines.append(line)
+
+    return('\n'.join(lines))
 
 
 def printable_summary(list_of_changed_files,
@@ -762,31 +1012,33 @@ def printable_summary(list_of_changed_files,
     + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + + +
     \n\n"""
 
-    build_summary = header
+    build_summary = [header]
+
+    number_of_vera_msgs = number_of_msgs_in_summary(summary_vera)
+    number_of_cppcheck_msgs = number_of_msgs_in_summary(summary_cppcheck)
+    number_of_format_msgs = number_of_msgs_in_summary(summary_format)
+    number_of_pep8_msgs = number_of_msgs_in_summary(summary_pep8)
 
-    if number_of_msgs_in_summary(summary_vera) > 0 or \
-       number_of_msgs_in_summary(summary_cppcheck) > 0 or \
-       number_of_msgs_in_summary(summary_format) > 0 or \
-       number_of_msgs_in_summary(summary_pep8) > 0:
+    if number_of_vera_msgs > 0 or number_of_cppcheck_msgs > 0 or \
+       number_of_format_msgs > 0 or number_of_pep8_msgs > 0:
 
-        build_summary += '  S T A T I C   C O D E   A N A L Y S I S\n'
+        build_summary.append('  S T A T I C   C O D E   A N A L Y S I S\n')
 
         # Create formatted per-file-tables of VERA++, Cppcheck, clang-format
         # and PEP8 messages.
-        build_summary += code_analysis_per_file_tables(summary_vera,
-                                                       summary_cppcheck,
-                                                       summary_format,
-                                                       summary_pep8)
+        build_summary.append(
+            code_analysis_per_file_tables(summary_vera, summary_cppcheck,
+                                          summary_format, summary_pep8))
 
     if number_of_warnings > 0:
-        build_summary += '\n  W A R N I N G S\n'
-        build_summary += warnings_table(summary_warnings)
+        build_summary.append('\n  W A R N I N G S\n')
+        build_summary.append(warnings_table(summary_warnings))
 
     if number_of_errors > 0:
-        build_summary += '\n  E R R O R S\n'
-        build_summary += errors_table(summary_errors)
+        build_summary.append('\n  E R R O R S\n')
+        build_summary.append(errors_table(summary_errors))
 
-    build_summary += '\n\n  B U I L D   R E P O R T\n'
+    build_summary.append('\n\n  B U I L D   R E P O R T\n')
 
     summary_table = [
         ['Changed Files :', ''],
@@ -798,49 +1050,52 @@ def printable_summary(list_of_changed_files,
         ['clang-format',
          convert_bool_value_to_status_string(status_format_init)],
         ['Static Code Analysis :', ''],
-        ['VERA++', convert_summary_to_status_string(summary_vera) +
-         '\n' + '\nNumber of messages (MSGBLD0135): ' +
-         str(number_of_msgs_in_summary(summary_vera))],
+        ['VERA++',
+         '{0}\n\nNumber of messages (MSGBLD0135): {1}'.format(
+             convert_summary_to_status_string(summary_vera),
+             number_of_vera_msgs)],
         ['Cppcheck (DEACTIVATED)',
-         convert_summary_to_status_string(summary_cppcheck) +
-         '\n' + '\nNumber of messages (MSGBLD0155): ' +
-         str(number_of_msgs_in_summary(summary_cppcheck))],
-        ['clang-format', convert_summary_to_status_string(summary_format) +
-         '\n' + '\nNumber of messages (MSGBLD0175): ' +
-         str(number_of_msgs_in_summary(summary_format))],
-        ['PEP8', convert_summary_to_status_string(summary_pep8) + '\n' +
-         '\nNumber of messages (MSGBLD0195): ' +
-         str(number_of_msgs_in_summary(summary_pep8))],
+         '{0}\n\nNumber of messages (MSGBLD0155): {1}'.format(
+             convert_summary_to_status_string(summary_cppcheck),
+             number_of_cppcheck_msgs)],
+        ['clang-format',
+         '{0}\n\nNumber of messages (MSGBLD0175): {1}'.format(
+             convert_summary_to_status_string(summary_format),
+             number_of_format_msgs)],
+        ['PEP8',
+         '{0}\n\nNumber of messages (MSGBLD0195): {1}'.format(
+             convert_summary_to_status_string(summary_pep8),
+             number_of_pep8_msgs)],
         ['NEST Build :', ''],
         ['CMake configure',
          convert_bool_value_to_status_string(status_cmake_configure)],
-        ['Make', convert_bool_value_to_status_string(status_make) + '\n' +
-         '\nErrors  : ' + str(number_of_errors) +
-         '\nWarnings: ' + str(number_of_warnings)],
+        ['Make',
+         '{0}\n\nErrors  : {1}\nWarnings: {2}'.format(
+             convert_bool_value_to_status_string(status_make),
+             number_of_errors, number_of_warnings)],
         ['Make install',
          convert_bool_value_to_status_string(status_make_install)],
         ['Make installcheck',
-         convert_bool_value_to_status_string(status_tests) + '\n' +
-         '\nTotal number of tests : ' + str(number_of_tests_total) +
-         '\nNumber of tests failed: ' + str(number_of_tests_failed)],
+         '{0}\n\nTotal number of tests : {1}\nNumber of tests failed: {2}'
+         .format(convert_bool_value_to_status_string(status_tests),
+                 number_of_tests_total, number_of_tests_failed)],
         ['Artifacts :', ''],
         ['Amazon S3 upload',
          convert_bool_value_to_yes_no_string(status_amazon_s3_upload)]
     ]
-    table = AsciiTable(summary_table)
-    table.inner_row_border = True
-    max_width = table.column_max_width(1)
-    table.table_data[1][1] = '\n'.join(wrap(', '.join(list_of_changed_files),
-                                            max_width))
+    # The changed files fill the second column up to the width of the report,
+    # less the borders and the padding of both columns.
+    max_width = REPORT_WIDTH - max(len(row[0]) for row in summary_table) - 7
+    summary_table[1][1] = wrap_file_names(list_of_changed_files, max_width)
 
-    build_summary += table.table + '\n'
+    build_summary.append(ascii_table(summary_table) + '\n')
 
     if exit_code == 0:
-        build_summary += '\nBUILD TERMINATED SUCCESSFULLY'
+        build_summary.append('\nBUILD TERMINATED SUCCESSFULLY')
     else:
-        build_summary += '\nBUILD FAILED'
+        build_summary.append('\nBUILD FAILED')
 
-    return(build_summary)
+    return(''.join(build_summary))
 
 
 def build_return_code(status_vera_init,
@@ -898,70 +1153,208 @@ def build_return_code(status_vera_init,
        (status_make) and \
        (status_make_install) and \
        (status_tests) and \
-       (number_of_msgs_in_summary(summary_vera) == 0) and \
-       (number_of_msgs_in_summary(summary_cppcheck) == 0) and \
-       (number_of_msgs_in_summary(summary_format) == 0) and \
-       (number_of_msgs_in_summary(summary_pep8) == 0):
+       not is_any_msg_in_summary(summary_vera) and \
+       not is_any_msg_in_summary(summary_cppcheck) and \
+       not is_any_msg_in_summary(summary_format) and \
+       not is_any_msg_in_summary(summary_pep8):
 
         return(0)
     else:
         return(1)
 
 
+def summary_cache_directory():
+    """Return the cache directory of the current user in the temporary
+    directory. It is created if it does not exist yet. Other users could plant
+    a summary in a directory they have access to, so it is only used if it is
+    a directory owned by the current user and inaccessible to anyone else.
+
+    Returns
+    -------
+    None or cache directory name.
+    """
+
+    cache_dir = os.path.join(tempfile.gettempdir(),
+                             'parse_travis_log-{0}'.format(os.getuid()))
+    try:
+        os.mkdir(cache_dir, 0o700)
+    except OSError:
+        pass
+
+    try:
+        st = os.lstat(cache_dir)
+    except OSError:
+        return(None)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or \
+       st.st_mode & 0o077:
+        return(None)
+
+    return(cache_dir)
+
+
+def summary_cache_filename(log_filename):
+    """Return the name of the file which caches the build summary of the NEST
+    Travis CI build log file. The name changes with the log file and with this
+    script.
+
+    Parameters
+    ----------
+    log_filename: NEST Travis CI build log file name.
+
+    Returns
+    -------
+    None if there is no safe cache directory, otherwise cache file name.
+    """
+
+    cache_dir = summary_cache_directory()
+    if cache_dir is None:
+        return(None)
+
+    key = (parsed_log_cache_key(os.path.abspath(log_filename)) +
+           parsed_log_cache_key(os.path.abspath(__file__)))
+    digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+    return(os.path.join(cache_dir, digest))
+
+
+def read_cached_summary(cache_filename):
+    """Read the build return code and the printable build summary from the
+    cache file. The file is only trusted if it is a regular file, not a
+    symbolic link, owned by the current user.
+
+    Parameters
+    ----------
+    cache_filename: Cache file name, see summary_cache_filename().
+
+    Returns
+    -------
+    None if there is no valid cache file, otherwise a tuple of the return
+    code and the build summary string.
+    """
+
+    try:
+        fd = os.open(cache_filename,
+                     os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    except OSError:
+        return(None)
+
+    try:
+        with os.fdopen(fd, 'rb') as fh:
+            st = os.fstat(fh.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid():
+                return(None)
+            exit_code, _, summary = fh.read().partition(b'\n')
+        exit_code = int(exit_code)
+    except (IOError, OSError, ValueError):
+        return(None)
+    if exit_code not in (0, 1):
+        return(None)
+
+    return((exit_code, decode(summary)))
+
+
+def write_cached_summary(cache_filename, exit_code, summary):
+    """Write the build return code and the printable build summary to the
+    cache file. The summary is only cached if the file can be written.
+
+    Parameters
+    ----------
+    cache_filename: Cache file name, see summary_cache_filename().
+    exit_code:      Build exit code: 0 or 1.
+    summary:        Formatted build summary string.
+    """
+
+    # The summary is written to a new file, which is created exclusively and
+    # renamed when complete. A concurrent reader sees either no file or the
+    # complete file.
+    try:
+        fd, tmp_filename = tempfile.mkstemp(
+            dir=os.path.dirname(cache_filename))
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write('{0}\n'.format(exit_code).encode('ascii'))
+            fh.write(summary.encode('utf-8'))
+        os.rename(tmp_filename, cache_filename)
+    except (IOError, OSError):
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+
+
+def print_summary(summary):
+    """Write the printable build summary to the standard output at once. It
+    is encoded as UTF-8, independent of the locale of the build environment.
+
+    Parameters
+    ----------
+    summary: Formatted build summary string.
+    """
+
+    # Python 2 has no separate binary buffer of the standard output.
+    stdout = getattr(sys.stdout, 'buffer', sys.stdout)
+    stdout.write((summary + '\n').encode('utf-8'))
+    stdout.flush()
+
+
 if __name__ == '__main__':
     from sys import argv, exit
-    from terminaltables import AsciiTable
-    from textwrap import wrap
 
     this_script_filename, log_filename = argv
 
-    changed_files = \
-        list_of_changed_files(log_filename, "MSGBLD0070",
-                              "MSGBLD0100", "MSGBLD0095")
+    # The summary of a log file which has been processed before is printed
+    # from the cache, e.g. when the build summary is requested again.
+    cache_filename = summary_cache_filename(log_filename)
+    if cache_filename is not None:
+        cached_summary = read_cached_summary(cache_filename)
+        if cached_summary is not None:
+            exit_code, summary = cached_summary
+            print_summary(summary)
+            exit(exit_code)
+
+    changed_files = list_of_changed_files(log_filename)
 
     # The NEST Travis CI build consists of several steps and sections.
     # Each section is enclosed in a start- and an end-message.
     # By checking these message-pairs it can be verified whether a section
     # passed through successfully, failed or was skipped.
     status_vera_init = \
-        is_message_pair_in_logfile(log_filename, "MSGBLD0010", "MSGBLD0020")
+        is_message_pair_in_logfile(log_filename, b"MSGBLD0010", b"MSGBLD0020")
 
     status_cppcheck_init = \
-        is_message_pair_in_logfile(log_filename, "MSGBLD0030", "MSGBLD0040")
+        is_message_pair_in_logfile(log_filename, b"MSGBLD0030", b"MSGBLD0040")
 
     status_format_init = \
-        is_message_pair_in_logfile(log_filename, "MSGBLD0050", "MSGBLD0060")
+        is_message_pair_in_logfile(log_filename, b"MSGBLD0050", b"MSGBLD0060")
 
     status_cmake_configure = \
-        is_message_pair_in_logfile(log_filename, "MSGBLD0230", "MSGBLD0240")
+        is_message_pair_in_logfile(log_filename, b"MSGBLD0230", b"MSGBLD0240")
 
     status_make_install = \
-        is_message_pair_in_logfile(log_filename, "MSGBLD0270", "MSGBLD0280")
+        is_message_pair_in_logfile(log_filename, b"MSGBLD0270", b"MSGBLD0280")
 
     status_amazon_s3_upload = \
-        not is_message_in_logfile(log_filename, "MSGBLD0330")
+        not is_message_in_logfile(log_filename, b"MSGBLD0330")
 
     # Summarize the per file results from the static code analysis.
-    summary_vera = msg_summary_vera(log_filename, "MSGBLD0130",
-                                    "MSGBLD0140", "MSGBLD0135")
+    summary_vera = msg_summary_vera(log_filename)
 
-    summary_cppcheck = msg_summary_cppcheck(log_filename, "MSGBLD0150",
-                                            "MSGBLD0160", "MSGBLD0155")
+    summary_cppcheck = msg_summary_cppcheck(log_filename)
 
-    summary_format = msg_summary_format(log_filename, "MSGBLD0170",
-                                        "MSGBLD0180", "MSGBLD0175")
+    summary_format = msg_summary_format(log_filename)
 
-    summary_pep8 = msg_summary_pep8(log_filename, "MSGBLD0190",
-                                    "MSGBLD0200", "MSGBLD0195")
+    summary_pep8 = msg_summary_pep8(log_filename)
 
     # Summarize the per file build error messages and warnings.
     status_make, number_of_errors, summary_errors, number_of_warnings, \
-        summary_warnings = makebuild_summary(log_filename, "MSGBLD0250",
-                                             "MSGBLD0260")
+        summary_warnings = makebuild_summary(log_filename)
 
     # Summarize the NEST test suite results.
     status_tests, number_of_tests_total, number_of_tests_failed = \
-        testsuite_results(log_filename, "MSGBLD0290", "MSGBLD0300")
+        testsuite_results(log_filename)
 
     exit_code = build_return_code(status_vera_init,
                                   status_cppcheck_init,
@@ -975,25 +1368,28 @@ if __name__ == '__main__':
                                   summary_format,
                                   summary_pep8)
 
-    print(printable_summary(changed_files,
-                            status_vera_init,
-                            status_cppcheck_init,
-                            status_format_init,
-                            status_cmake_configure,
-                            status_make,
-                            status_make_install,
-                            status_amazon_s3_upload,
-                            status_tests,
-                            summary_vera,
-                            summary_cppcheck,
-                            summary_format,
-                            summary_pep8,
-                            summary_errors,
-                            summary_warnings,
-                            number_of_errors,
-                            number_of_warnings,
-                            number_of_tests_total,
-                            number_of_tests_failed,
-                            exit_code))
-
+    summary = printable_summary(changed_files,
+                                status_vera_init,
+                                status_cppcheck_init,
+                                status_format_init,
+                                status_cmake_configure,
+                                status_make,
+                                status_make_install,
+                                status_amazon_s3_upload,
+                                status_tests,
+                                summary_vera,
+                                summary_cppcheck,
+                                summary_format,
+                                summary_pep8,
+                                summary_errors,
+                                summary_warnings,
+                                number_of_errors,
+                                number_of_warnings,
+                                number_of_tests_total,
+                                number_of_tests_failed,
+                                exit_code)
+    if cache_filename is not None:
+        write_cached_summary(cache_filename, exit_code, summary)
+
+    print_summary(summary)
     exit(exit_code)